@@ -1,2 +1,15 @@
+import importlib
+
+# Submodules are imported on first attribute access so that ``import ts_trove`` does not
+# pull in the heavy dependencies (plotly, statsmodels, numba) of modules that are not used.
+_SUBMODULES = ("anomaly_detection", "classification", "eda", "forecasting")
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def hello() -> str:
     return "Hello from ts-trove!"
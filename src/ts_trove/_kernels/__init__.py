@@ -0,0 +1,25 @@
+"""Numba kernels shared by the ts_trove modules."""
+import numpy as np
+
+# Options of every kernel. Compiled kernels are cached on disk next to the sources (or under
+# NUMBA_CACHE_DIR when set), so only the first process pays the compilation. The fast-math
+# flags leave out 'nnan' and 'ninf' because the kernels rely on NaN checks for missing values.
+JIT_OPTIONS = dict(cache=True, nogil=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+
+
+def _warm_cache() -> None:
+    """
+    Call every kernel once on a tiny input so it is loaded from the on-disk cache (or compiled)
+    up front instead of on the first real call.
+    """
+
+    from ts_trove._kernels.acf import acf_fused
+    from ts_trove._kernels.diff import diff1
+    from ts_trove._kernels.lttb import lttb_indices
+    from ts_trove._kernels.rolling import rolling_mean_std
+
+    x = np.arange(4, dtype=np.float64)
+    acf_fused(x, 1)
+    diff1(x)
+    lttb_indices(x, x, 3)
+    rolling_mean_std(x, 2)
@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit
+from ts_trove._kernels import JIT_OPTIONS
+
+
+@njit(**JIT_OPTIONS)
+def acf_fused(x: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Compute the sample autocorrelation function with one fused loop per lag.
+
+    Computes the same (biased, demeaned) estimator as ``statsmodels.tsa.stattools.acf``, but
+    accumulates each lag's cross products in a single pass without slicing or temporary arrays.
+    For small max_lag this beats both the time-domain and the FFT paths of statsmodels.
+
+    Parameters:
+    x (np.ndarray): 1D C-contiguous float64 array without NaNs.
+    max_lag (int): Number of lags to compute.
+
+    Returns:
+    np.ndarray: ACF values for lags 0..max_lag.
+    """
+
+    n = x.size
+    mean = 0.0
+    for i in range(n):
+        mean += x[i]
+    mean /= n
+
+    ss = 0.0
+    for i in range(n):
+        d = x[i] - mean
+        ss += d * d
+
+    out = np.empty(max_lag + 1)
+    out[0] = 1.0
+    for lag in range(1, max_lag + 1):
+        s12 = 0.0
+        for i in range(n - lag):
+            s12 += (x[i] - mean) * (x[i + lag] - mean)
+        out[lag] = s12 / ss
+    return out
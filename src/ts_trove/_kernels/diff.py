@@ -0,0 +1,21 @@
+import numpy as np
+from numba import njit
+from ts_trove._kernels import JIT_OPTIONS
+
+
+@njit(**JIT_OPTIONS)
+def diff1(x: np.ndarray) -> np.ndarray:
+    """
+    Compute the first difference x[i + 1] - x[i] of a 1D array.
+
+    Parameters:
+    x (np.ndarray): 1D float64 array of observations.
+
+    Returns:
+    np.ndarray: Array of length len(x) - 1 with the first differences.
+    """
+
+    out = np.empty(max(x.size - 1, 0), x.dtype)
+    for i in range(x.size - 1):
+        out[i] = x[i + 1] - x[i]
+    return out
@@ -0,0 +1,79 @@
+import numpy as np
+from numba import njit
+from ts_trove._kernels import JIT_OPTIONS
+
+
+@njit(**JIT_OPTIONS)
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the points kept by the Largest-Triangle-Three-Buckets downsampling algorithm.
+
+    The first and last points are always kept. The points in between are split into
+    n_out - 2 buckets and, for each bucket, the point forming the largest triangle with
+    the previously selected point and the average of the next bucket is kept. NaN values
+    are skipped when averaging a bucket and never win a bucket unless it is all NaN.
+
+    Parameters:
+    x (np.ndarray): 1D float64 array of x coordinates, sorted in increasing order.
+    y (np.ndarray): 1D float64 array of y coordinates.
+    n_out (int): Number of points to keep, at least 3 and less than len(y).
+
+    Returns:
+    np.ndarray: Sorted int64 indices of the kept points.
+    """
+
+    n = y.size
+    selected = np.empty(n_out, np.int64)
+    selected[0] = 0
+    selected[n_out - 1] = n - 1
+
+    # Bucket i covers [edges[i], edges[i + 1])
+    edges = np.empty(n_out - 1, np.int64)
+    step = (n - 2) / (n_out - 2)
+    for i in range(n_out - 1):
+        edges[i] = 1 + np.int64(i * step)
+    edges[n_out - 2] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start = edges[i]
+        stop = edges[i + 1]
+
+        if i == n_out - 3:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+        else:
+            sum_x = 0.0
+            sum_y = 0.0
+            count = 0
+            for j in range(stop, edges[i + 2]):
+                if not np.isnan(y[j]):
+                    sum_x += x[j]
+                    sum_y += y[j]
+                    count += 1
+            if count:
+                avg_x = sum_x / count
+                avg_y = sum_y / count
+            else:
+                avg_x = x[stop]
+                avg_y = y[a]
+
+        best = -1
+        best_area = -1.0
+        ax = x[a]
+        ay = y[a]
+        for j in range(start, stop):
+            if np.isnan(y[j]):
+                continue
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        if best < 0:
+            # All-NaN bucket: keep its first point but anchor the next bucket on the last valid one
+            selected[i + 1] = start
+        else:
+            a = best
+            selected[i + 1] = a
+
+    return selected
@@ -0,0 +1,56 @@
+import numpy as np
+from numba import njit
+from ts_trove._kernels import JIT_OPTIONS
+
+
+@njit(**JIT_OPTIONS)
+def rolling_mean_std(x: np.ndarray, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the rolling mean and rolling standard deviation in a single forward pass.
+
+    Uses Welford-style incremental updates of the window mean and sum of squared deviations,
+    adding the incoming observation and removing the outgoing one at each step. Matches
+    pandas' ``Series.rolling(w).mean()`` / ``.std()``: a value is only emitted once the window
+    holds w non-NaN observations and the standard deviation uses ddof=1.
+
+    Parameters:
+    x (np.ndarray): 1D float64 array of observations.
+    w (int): Window size.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The rolling mean and the rolling standard deviation.
+    """
+
+    n = x.size
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+
+    nobs = 0
+    mean_x = 0.0
+    ssqdm_x = 0.0
+    for i in range(n):
+        val = x[i]
+        if not np.isnan(val):
+            nobs += 1
+            delta = val - mean_x
+            mean_x += delta / nobs
+            ssqdm_x += ((nobs - 1) * delta ** 2) / nobs
+
+        if i >= w:
+            val = x[i - w]
+            if not np.isnan(val):
+                nobs -= 1
+                if nobs:
+                    delta = val - mean_x
+                    mean_x -= delta / nobs
+                    ssqdm_x -= ((nobs + 1) * delta ** 2) / nobs
+                else:
+                    mean_x = 0.0
+                    ssqdm_x = 0.0
+
+        if nobs == w:
+            mean[i] = mean_x
+            if w > 1:
+                std[i] = np.sqrt(max(ssqdm_x / (w - 1), 0.0))
+
+    return mean, std
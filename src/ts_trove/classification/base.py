@@ -12,14 +12,53 @@ class BaseClassifier(ABC):
 
     All time series classification techniques should inherit from this class
     and implement the required abstract methods.
+
+    Implementations should convert their input with `_to_ndarray` (or
+    `_require_float64_contig` for numeric kernels) as the first line of
+    `fit`, `predict`, `predict_proba` and `score`, so the rest of the
+    method only deals with a NumPy array.
+
+    The base class declares `__slots__` to keep instances small when many
+    models are created (ensembles, per-series fits). Subclasses that want to
+    keep this benefit must declare their own `__slots__` for any attribute
+    they add; otherwise they get a regular `__dict__`.
     """
 
+    __slots__ = ("is_fitted", "params", "classes_")
+
     def __init__(self):
         """Initialize the classifier."""
         self.is_fitted = False
         self.params: dict[str, Any] = {}
         self.classes_: np.ndarray | None = None
 
+    @staticmethod
+    def _to_ndarray(X: np.ndarray | pd.DataFrame | pd.Series) -> np.ndarray:
+        """Convert input data to a NumPy array without copying when possible.
+
+        Args:
+            X: Time series data as a NumPy array or pandas object
+
+        Returns:
+            The data as a NumPy array
+        """
+        return X.to_numpy(copy=False) if hasattr(X, "to_numpy") else np.ascontiguousarray(X)
+
+    @staticmethod
+    def _require_float64_contig(x: np.ndarray | pd.DataFrame | pd.Series) -> np.ndarray:
+        """Convert input data to a C-contiguous float64 array.
+
+        This is the layout expected by compiled (e.g. Numba) kernels. No copy is
+        made if the data already has it.
+
+        Args:
+            x: Time series data as a NumPy array or pandas object
+
+        Returns:
+            The data as a C-contiguous float64 array
+        """
+        return np.ascontiguousarray(x, dtype=np.float64)
+
     @abstractmethod
     def fit(self, X: np.ndarray | pd.DataFrame, y: np.ndarray | pd.Series) -> "BaseClassifier":
         """Fit the classification model to training data.
@@ -0,0 +1,17 @@
+"""Time series exploratory data analysis module."""
+
+import importlib
+
+# Classes are imported on first access so that importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    "UnivariateEDA": ".univaritate_eda",
+    "UnivaritateEDAReport": ".univariate_eda_report",
+}
+
+__all__ = ["UnivariateEDA", "UnivaritateEDAReport"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,128 @@
+from html import escape
+from numbers import Integral, Real
 from pathlib import Path
-from ts_trove.eda.univaritate_eda import UnivariateEDA
-from plotly.subplots import make_subplots
-import plotly.graph_objects as go
+from typing import TYPE_CHECKING
+import numpy as np
+from ts_trove.eda.univaritate_eda import UnivariateEDA, _bar_histogram, _downsample_lttb
+
+# plotly is imported inside the functions that build figures so that it is only
+# loaded once a report is actually generated
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Series longer than this are downsampled before being handed to the scatter/box traces
+_DOWNSAMPLE_THRESHOLD = 5000
+_DOWNSAMPLE_POINTS = 2000
+# Quantiles standing in for the raw data of a box trace; they preserve the box/whisker geometry
+_BOX_QUANTILES = np.linspace(0, 1, 1001)
+
+# (lags of the ACF/PACF row, lags of the resampled row, resampling rule) of the self-correlation
+# panel, keyed by the frequency alias returned by pd.infer_freq
+_FREQ_LAGS: dict[str, tuple[int, int, str]] = {
+    'M': (12, 60, 'h'),
+    'ME': (12, 60, 'h'),
+    'MS': (12, 60, 'h'),
+    'W': (4, 52, 'ME'),
+    'D': (30, 365, 'W'),
+    'h': (24, 168, 'D'),
+    'min': (60, 1440, 'h'),
+    's': (60, 3600, 'min'),
+}
+_DEFAULT_FREQ_LAGS = (24, 168, 'D')
+
+# Static fragments of the HTML report, pre-encoded so ``generate`` can stream them
+_REPORT_HEAD = b"""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <title>Univariate EDA Report</title>
+            <style>
+                body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background-color: #f4f7f6; color: #333; margin: 0; padding: 40px; }
+                .container { max-width: 1200px; margin: auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+                h1 { color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; margin-top: 40px; }
+                .table-container { margin-bottom: 30px; }
+                table { border-collapse: collapse; width: 100%; margin-top: 10px; }
+                th, td { text-align: left; padding: 12px; border-bottom: 1px solid #ddd; }
+                th { background-color: #3498db; color: white; }
+                tr:hover { background-color: #f1f1f1; }
+                .plot-card { background: #fff; border: 1px solid #eee; border-radius: 4px; margin-bottom: 20px; padding: 10px; }
+            </style>
+"""
+# The Plotly bundle <script> tag is written between the head and body fragments
+_REPORT_BODY_OPEN = b"""
+        </head>
+        <body>
+            <div class="container">
+                <h1>Univariate EDA Report</h1>
+                
+                <h3>Time Index Description</h3>
+"""
+_TS_DIST_HEADING = b"""
+                <h1>Time Series & Distribution</h1>
+"""
+_STATIONARITY_HEADING = b"""
+                <h3>Stationarity Test Results</h3>
+"""
+_WINDOWED_HEADING = b"""
+                <h1>Windowed Statistics</h1>
+"""
+_SELF_CORR_HEADING = b"""
+                <h1>Self-Correlation Analysis</h1>
+"""
+_PLOTLY_SCRIPT_TAG = '            <script charset="utf-8" src="https://cdn.plot.ly/plotly-{version}.min.js"></script>'
+_PLOT_CARD_OPEN = b'                <div class="plot-card">'
+_PLOT_CARD_CLOSE = b'</div>\n'
+_REPORT_TAIL = b"""
+            </div>
+        </body>
+        </html>
+"""
+
+
+def _format_cell(value) -> str:
+    """
+    Format a table value for the report, shortening floats to 6 significant digits.
+
+    Parameters:
+    value: The value to format.
+
+    Returns:
+    str: The formatted value.
+    """
+
+    if isinstance(value, Real) and not isinstance(value, Integral):
+        return format(value, '.6g')
+    return str(value)
+
 
 class UnivaritateEDAReport:
     def __init__(self, univariate_eda: UnivariateEDA):
         self.univariate_eda = univariate_eda
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Recompute the artifacts cached by the report.
+
+        The time index description, stationarity results, panels and series arrays are computed
+        once and reused by every call to ``generate``. Call this after the underlying series of
+        ``univariate_eda`` changes.
+        """
+
         self.index_description = self.univariate_eda.describe_time_index()
+        self._stationarity_cache: dict | None = None
+
+        # Panels are memoized by name so repeat calls to ``generate`` (or to a
+        # panel directly) reuse the already computed figure.
+        self._panel_cache: dict[str, go.Figure] = {}
+        # Values converted once (the float64 buffer of univariate_eda) and shared by every trace.
+        # The index is kept as is: its .values would drop the time zone and plot UTC times.
+        ts = self.univariate_eda.ts
+        self._x = ts.index
+        self._y = self.univariate_eda.values()
+        self._diff_x = self._x[1:]
+        self._diff_y = self.univariate_eda.diff_cached()
 
     def generate_report(self, output_path: Path) -> None:
         """
@@ -32,7 +148,13 @@ class UnivaritateEDAReport:
         plotly.graph_objs._figure.Figure: A Plotly figure object displaying the time series.
         """
 
-        subplot_grid = make_subplots(rows=2, cols=3,
+        from plotly.subplots import make_subplots
+        import plotly.graph_objects as go
+
+        if 'ts_and_distribution' in self._panel_cache:
+            return self._panel_cache['ts_and_distribution']
+
+        subplot_grid = make_subplots(rows=2, cols=3, print_grid=False,
                             specs=[[{"type": "scatter"}, {"type": "xy"}, {"type": "histogram"}],
                                 [{"type": "scatter"}, {"type": "xy"}, {"type": "histogram"}]],
                             subplot_titles=[
@@ -48,40 +170,53 @@ class UnivaritateEDAReport:
                             horizontal_spacing=0.01,
                             vertical_spacing=0.1,
                             column_widths=[0.6, 0.1, 0.3])
+
+        ts = self.univariate_eda.ts
+        downsample = len(ts) > _DOWNSAMPLE_THRESHOLD
         
         # -- time series (1,1) --
-        time_series_plot = self.univariate_eda.plot_time_series()
-        time_series_plot.data[0].update(line=dict(color='darkblue'))
-        subplot_grid.add_trace(time_series_plot.data[0], row=1, col=1)
+        x, y = self._x, self._y
+        if downsample:
+            x, y = _downsample_lttb(x, y, _DOWNSAMPLE_POINTS)
+        subplot_grid.add_trace(
+            go.Scattergl(x=x, y=y, mode='lines', line=dict(color='darkblue'), name=ts.name,
+                         _validate=False),
+            row=1, col=1
+        )
 
         # -- box plot (1,2) --
+        box_values = np.nanquantile(self._y, _BOX_QUANTILES) if downsample else self._y
         subplot_grid.add_trace(
-            go.Box(y=self.univariate_eda.ts, marker=dict(color='darkblue'), name=''), row=1, col=2
+            go.Box(y=box_values, marker=dict(color='darkblue'), name='', _validate=False), row=1, col=2
         )
 
         # -- distribution histogram (1,3) --
-        distribution_histogram = self.univariate_eda.plot_distribution_histogram(orientation='h')
-        distribution_histogram.data[0].update(marker=dict(color='darkblue'))
-        subplot_grid.add_trace(distribution_histogram.data[0], row=1, col=3)
+        subplot_grid.add_trace(_bar_histogram(self._y, orientation='h', color='darkblue'), row=1, col=3)
 
         # -- differenced time series and distribution (2,1) --
-        diff_ts_plot = self.univariate_eda.plot_time_series(differenced=True)
-        diff_ts_plot.data[0].update(line=dict(color='lightblue'))
-        subplot_grid.add_trace(diff_ts_plot.data[0], row=2, col=1)
+        x, y = self._diff_x, self._diff_y
+        if downsample:
+            x, y = _downsample_lttb(x, y, _DOWNSAMPLE_POINTS)
+        subplot_grid.add_trace(
+            go.Scattergl(x=x, y=y, mode='lines', line=dict(color='lightblue'), name=ts.name,
+                         _validate=False),
+            row=2, col=1
+        )
 
         # -- differenced box plot (2,2) --
+        diff_box_values = np.nanquantile(self._diff_y, _BOX_QUANTILES) if downsample else self._diff_y
         subplot_grid.add_trace(
-            go.Box(y=self.univariate_eda.ts.diff().dropna(), marker=dict(color='lightblue'), name=''), row=2, col=2
+            go.Box(y=diff_box_values, marker=dict(color='lightblue'), name='', _validate=False),
+            row=2, col=2
         )
 
         # -- differenced distribution histogram (2,3) --
-        differenced_distribution_histogram = self.univariate_eda.plot_distribution_histogram(differenced=True, orientation='h')
-        differenced_distribution_histogram.data[0].update(marker=dict(color='lightblue'))
-        subplot_grid.add_trace(differenced_distribution_histogram.data[0], row=2, col=3)
+        subplot_grid.add_trace(_bar_histogram(self._diff_y, orientation='h', color='lightblue'), row=2, col=3)
         
         # hide legend
         subplot_grid.update_layout(showlegend=False, margin=dict(t=50, b=20, l=20, r=20))
 
+        self._panel_cache['ts_and_distribution'] = subplot_grid
         return subplot_grid
     
     def _windowed_statistics_panel(self) -> None:
@@ -92,69 +227,117 @@ class UnivaritateEDAReport:
         plotly.graph_objs._figure.Figure: A Plotly figure object displaying the rolling statistics.
         """
 
+        if 'windowed_statistics' in self._panel_cache:
+            return self._panel_cache['windowed_statistics']
+
         rolling_stats_plot = self.univariate_eda.plot_rolling_statistics()
         rolling_stats_plot.update_layout(margin=dict(t=50, b=20, l=20, r=20))
 
+        self._panel_cache['windowed_statistics'] = rolling_stats_plot
         return rolling_stats_plot
     
     def _self_correlation_panel(self) -> None:
         """
         Plot ACF and PACF panels.
 
+        The second row plots the ACF and PACF of the resampled series; it is left out when the
+        resampled series has fewer than 4 observations.
+
         Returns:
         plotly.graph_objs._figure.Figure: A Plotly figure object displaying the ACF and PACF.
+
+        Raises:
+        ValueError: If the time series has fewer than 2 observations.
         """
 
-        subplot_grid = make_subplots(rows=2, cols=2,
-                            specs=[[{"type": "scatter"}, {"type": "scatter"}],
-                                   [{"type": "scatter"}, {"type": "scatter"}]],
+        from plotly.subplots import make_subplots
+
+        if 'self_correlation' in self._panel_cache:
+            return self._panel_cache['self_correlation']
+
+        # Anchored aliases such as 'W-SUN' are looked up by their base alias
+        inferred_freq = (self.index_description.get('inferred_frequency') or 'h').split('-')[0]
+        lag1, lag2, resample_to = _FREQ_LAGS.get(inferred_freq, _DEFAULT_FREQ_LAGS)
+
+        # The resampled series is cached by univariate_eda; both plots of the resampled row reuse it
+        ts = self.univariate_eda.ts
+        if len(ts) < 2:
+            raise ValueError("The ACF and PACF panels need a time series of at least 2 observations.")
+        resampled = self.univariate_eda.resampled(resample_to)
+        # The PACF is only defined for lags below half the sample size; at least one lag is plotted
+        lag1 = max(min(lag1, len(ts) // 2 - 1), 1)
+        lag2 = min(lag2, len(resampled) // 2 - 1)
+        # The resampled row is left out when the resampled series is too short for a single lag
+        n_rows = 2 if lag2 >= 1 else 1
+
+        subplot_grid = make_subplots(rows=n_rows, cols=2, print_grid=False,
+                            specs=[[{"type": "scatter"}, {"type": "scatter"}]] * n_rows,
                             subplot_titles=[
                                 'ACF',
                                 'PACF',
                                 'ACF - Resampled',
                                 'PACF - Resampled'
-                            ],
+                            ][:2 * n_rows],
                             horizontal_spacing=0.15,
                             column_widths=[0.5, 0.5])
-        
-        inferred_freq = self.index_description.get('inferred_frequency', 'h')
-        if inferred_freq == 'M':
-            lag1, lag2 = 12, 60
-            resample_to = 'h'  
-        elif inferred_freq == 'h':
-            lag1, lag2 = 24, 168
-            resample_to = 'd'
-        elif inferred_freq == 'd':
-            lag1, lag2 = 30, 365
-            resample_to = 'w'
 
+        # One ACF per series, shared by the ACF and PACF plots of each row and cached by
+        # univariate_eda, so describe_acf calls with the same lags reuse it
+        acf_values = self.univariate_eda.acf_values(lag1)
 
         # -- ACF (1,1) --
-        acf_plot = self.univariate_eda.plot_acf(nlags=lag1)
+        acf_plot = self.univariate_eda.plot_acf(nlags=lag1, precomputed_acf=acf_values)
         acf_plot.data[0].update(marker=dict(color='darkblue'))
         subplot_grid.add_trace(acf_plot.data[0], row=1, col=1)
 
         # -- PACF (1,2) --
-        pacf_plot = self.univariate_eda.plot_pacf(nlags=lag1)
+        pacf_plot = self.univariate_eda.plot_pacf(nlags=lag1, precomputed_acf=acf_values)
         pacf_plot.data[0].update(marker=dict(color='darkblue'))
         subplot_grid.add_trace(pacf_plot.data[0], row=1, col=2)
 
-        # -- ACF Resampled (2,1) --
-        acf_rs_plot = self.univariate_eda.plot_acf(nlags=lag2, resample_to=resample_to)
-        acf_rs_plot.data[0].update(marker=dict(color='darkblue'))
-        subplot_grid.add_trace(acf_rs_plot.data[0], row=2, col=1)
+        if n_rows == 2:
+            acf_rs_values = self.univariate_eda.acf_values(lag2, resample_to)
+
+            # -- ACF Resampled (2,1) --
+            acf_rs_plot = self.univariate_eda.plot_acf(nlags=lag2, precomputed_acf=acf_rs_values,
+                                                       resample_to=resample_to)
+            acf_rs_plot.data[0].update(marker=dict(color='darkblue'))
+            subplot_grid.add_trace(acf_rs_plot.data[0], row=2, col=1)
 
-        # -- PACF Resampled (2,2) --
-        pacf_rs_plot = self.univariate_eda.plot_pacf(nlags=lag2, resample_to=resample_to)
-        pacf_rs_plot.data[0].update(marker=dict(color='darkblue'))
-        subplot_grid.add_trace(pacf_rs_plot.data[0], row=2, col=2)
+            # -- PACF Resampled (2,2) --
+            pacf_rs_plot = self.univariate_eda.plot_pacf(nlags=lag2, precomputed_acf=acf_rs_values,
+                                                         resample_to=resample_to)
+            pacf_rs_plot.data[0].update(marker=dict(color='darkblue'))
+            subplot_grid.add_trace(pacf_rs_plot.data[0], row=2, col=2)
 
         subplot_grid.update_layout(showlegend=False, margin=dict(t=50, b=20, l=20, r=20))
 
+        self._panel_cache['self_correlation'] = subplot_grid
         return subplot_grid
     
+    @staticmethod
+    def _render_panel(builder) -> str:
+        """
+        Build a panel and serialize it to an HTML fragment.
+
+        Only the <div> and <script> parts are returned (full_html=False). The figures are built by
+        this module, so they are not re-validated against the Plotly schema.
+
+        Parameters:
+        builder (Callable[[], go.Figure]): One of the panel methods.
+
+        Returns:
+        str: The panel HTML.
+        """
+
+        fig = builder()
+        return fig.to_html(full_html=False, include_plotlyjs=False, include_mathjax=False, validate=False)
+
     def _write_html_table(self, d: dict) -> str:
-        rows = "".join([f"<tr><td><strong>{k}</strong></td><td>{v}</td></tr>" for k, v in d.items()])
+        rows = "".join(
+            f"<tr><td><strong>{escape(str(k))}</strong></td><td>{escape(_format_cell(v))}</td></tr>"
+            for k, v in d.items()
+        )
         return f"""
         <div class="table-container">
             <table>
@@ -169,57 +352,36 @@ class UnivaritateEDAReport:
             """
         
     def generate(self, output_path: Path) -> None:
+        from plotly.offline import get_plotlyjs_version
+
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Get content
-        tsi_html = self._write_html_table(self.univariate_eda.describe_time_index())
-        stationarity_html = self._write_html_table(self.univariate_eda.describe_stationarity())
+        if self._stationarity_cache is None:
+            self._stationarity_cache = self.univariate_eda.describe_stationarity()
+        tsi_html = self._write_html_table(self.index_description)
+        stationarity_html = self._write_html_table(self._stationarity_cache)
         
-        # Get Plotly HTML but extract only the <div> and <script> parts (full_html=False)
-        ts_dist = self._ts_and_distribution_panel().to_html(full_html=False, include_plotlyjs='cdn')
-        windowed = self._windowed_statistics_panel().to_html(full_html=False, include_plotlyjs=False)
-        self_corr = self._self_correlation_panel().to_html(full_html=False, include_plotlyjs=False)
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <title>Univariate EDA Report</title>
-            <style>
-                body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background-color: #f4f7f6; color: #333; margin: 0; padding: 40px; }}
-                .container {{ max-width: 1200px; margin: auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }}
-                h1 {{ color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; margin-top: 40px; }}
-                .table-container {{ margin-bottom: 30px; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 10px; }}
-                th, td {{ text-align: left; padding: 12px; border-bottom: 1px solid #ddd; }}
-                th {{ background-color: #3498db; color: white; }}
-                tr:hover {{ background-color: #f1f1f1; }}
-                .plot-card {{ background: #fff; border: 1px solid #eee; border-radius: 4px; margin-bottom: 20px; padding: 10px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Univariate EDA Report</h1>
-                
-                <h3>Time Index Description</h3>
-                {tsi_html}
-
-                <h1>Time Series & Distribution</h1>
-                <div class="plot-card">{ts_dist}</div>
-
-                <h3>Stationarity Test Results</h3>
-                {stationarity_html}
-
-                <h1>Windowed Statistics</h1>
-                <div class="plot-card">{windowed}</div>
-
-                <h1>Self-Correlation Analysis</h1>
-                <div class="plot-card">{self_corr}</div>
-            </div>
-        </body>
-        </html>
-        """
-
-        with open(output_path / "univariate_eda_report.html", "w") as f:
-            f.write(html_content)
\ No newline at end of file
+        # The report is streamed: static fragments are pre-encoded module constants and each
+        # panel is built and serialized just before it is written, so only one panel's HTML is
+        # held in memory at a time. The Plotly bundle is loaded once from the <head>.
+        with open(output_path / "univariate_eda_report.html", "wb", buffering=1 << 20) as f:
+            f.write(_REPORT_HEAD)
+            f.write(_PLOTLY_SCRIPT_TAG.format(version=get_plotlyjs_version()).encode())
+            f.write(_REPORT_BODY_OPEN)
+            f.write(tsi_html.encode())
+            f.write(_TS_DIST_HEADING)
+            f.write(_PLOT_CARD_OPEN)
+            f.write(self._render_panel(self._ts_and_distribution_panel).encode())
+            f.write(_PLOT_CARD_CLOSE)
+            f.write(_STATIONARITY_HEADING)
+            f.write(stationarity_html.encode())
+            f.write(_WINDOWED_HEADING)
+            f.write(_PLOT_CARD_OPEN)
+            f.write(self._render_panel(self._windowed_statistics_panel).encode())
+            f.write(_PLOT_CARD_CLOSE)
+            f.write(_SELF_CORR_HEADING)
+            f.write(_PLOT_CARD_OPEN)
+            f.write(self._render_panel(self._self_correlation_panel).encode())
+            f.write(_PLOT_CARD_CLOSE)
+            f.write(_REPORT_TAIL)
\ No newline at end of file
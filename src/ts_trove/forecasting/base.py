@@ -12,12 +12,29 @@ class BaseForecaster(ABC):
 
     All forecasting techniques should inherit from this class and implement
     the required abstract methods.
+
+    Models that produce the forecast as a by-product of fitting (e.g. from
+    the state left by likelihood maximization) can store it during `fit` in
+    `_fitted_forecast`, with its horizon in `_fitted_forecast_steps`.
+    `fit_predict` then returns it through `_cached_forecast` instead of
+    calling `predict`. Only do this when it is cheap; models that leave both
+    attributes unset always go through `predict`.
+
+    The base class declares `__slots__` to keep instances small when many
+    models are created (backtests fit one model per fold and parameter
+    combination). Subclasses that want to keep this benefit must declare
+    their own `__slots__` for any attribute they add; otherwise they get a
+    regular `__dict__`.
     """
 
+    __slots__ = ("is_fitted", "params", "_fitted_forecast", "_fitted_forecast_steps")
+
     def __init__(self):
         """Initialize the forecaster."""
         self.is_fitted = False
         self.params: dict[str, Any] = {}
+        self._fitted_forecast: np.ndarray | None = None
+        self._fitted_forecast_steps = 0
 
     @abstractmethod
     def fit(self, y: np.ndarray | pd.Series, X: np.ndarray | pd.DataFrame | None = None) -> "BaseForecaster":
@@ -57,9 +74,34 @@ class BaseForecaster(ABC):
         Returns:
             Forecasted values
         """
+        # Drop the forecast stored by a previous fit, in case this one does not store any
+        self._fitted_forecast = None
+        self._fitted_forecast_steps = 0
         self.fit(y, X)
+        # A forecast stored by fit does not account for exogenous variables of the forecast period
+        if X is None:
+            forecast = self._cached_forecast(steps)
+            if forecast is not None:
+                return forecast
         return self.predict(steps, X)
 
+    def _cached_forecast(self, steps: int) -> np.ndarray | None:
+        """Return the forecast stored by `fit`, if it covers the requested horizon.
+
+        Subclasses can override this hook to build the forecast from other
+        internal state.
+
+        Args:
+            steps: Number of steps ahead to forecast
+
+        Returns:
+            The first `steps` forecasted values, or None if `predict` must be called
+        """
+        forecast = getattr(self, "_fitted_forecast", None)
+        if forecast is not None and getattr(self, "_fitted_forecast_steps", 0) >= steps:
+            return forecast[:steps]
+        return None
+
     @abstractmethod
     def get_params(self) -> dict[str, Any]:
         """Get parameters of the forecaster.
@@ -0,0 +1,75 @@
+"""Tests of the BaseForecaster instance layout and fit_predict contract."""
+
+import sys
+
+import numpy as np
+
+from ts_trove.forecasting import BaseForecaster
+
+
+class LastValueForecaster(BaseForecaster):
+    __slots__ = ("last_value",)
+
+    def fit(self, y, X=None):
+        self.last_value = y[-1]
+        self.is_fitted = True
+        return self
+
+    def predict(self, steps, X=None):
+        return np.full(steps, self.last_value)
+
+    def get_params(self):
+        return self.params
+
+    def set_params(self, **params):
+        self.params.update(params)
+        return self
+
+
+def test_slotted_subclass_has_no_instance_dict():
+    forecaster = LastValueForecaster()
+
+    assert not hasattr(forecaster, "__dict__")
+    assert sys.getsizeof(forecaster) < 100
+
+
+
+class StoredForecastForecaster(LastValueForecaster):
+    __slots__ = ("predict_calls",)
+
+    def fit(self, y, X=None):
+        super().fit(y, X)
+        self.predict_calls = 0
+        self._fitted_forecast = np.arange(10.0)
+        self._fitted_forecast_steps = 10
+        return self
+
+    def predict(self, steps, X=None):
+        self.predict_calls += 1
+        return super().predict(steps, X)
+
+
+def test_fit_predict_returns_the_forecast_stored_by_fit():
+    forecaster = StoredForecastForecaster()
+
+    np.testing.assert_array_equal(forecaster.fit_predict(np.arange(5.0), steps=3), [0.0, 1.0, 2.0])
+    assert forecaster.predict_calls == 0
+
+
+def test_fit_predict_calls_predict_beyond_the_stored_horizon_or_with_exogenous_variables():
+    forecaster = StoredForecastForecaster()
+
+    np.testing.assert_array_equal(forecaster.fit_predict(np.arange(5.0), steps=12), [4.0] * 12)
+    assert forecaster.predict_calls == 1
+    np.testing.assert_array_equal(forecaster.fit_predict(np.arange(5.0), steps=3, X=np.ones((5, 1))),
+                                  [4.0] * 3)
+    assert forecaster.predict_calls == 1
+
+
+def test_fit_predict_does_not_reuse_a_previous_stored_forecast():
+    forecaster = LastValueForecaster()
+    forecaster.fit_predict(np.arange(5.0), steps=3)
+    forecaster._fitted_forecast = np.zeros(10)
+    forecaster._fitted_forecast_steps = 10
+
+    np.testing.assert_array_equal(forecaster.fit_predict(np.arange(100.0), steps=3), [99.0] * 3)
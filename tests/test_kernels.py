@@ -0,0 +1,63 @@
+"""Tests of the Numba kernels against the pandas and statsmodels reference implementations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.stattools import acf
+
+from ts_trove._kernels.acf import acf_fused
+from ts_trove._kernels.lttb import lttb_indices
+from ts_trove._kernels.rolling import rolling_mean_std
+from ts_trove.eda.univaritate_eda import _FUSED_ACF_MAX_LAGS, UnivariateEDA
+
+
+@pytest.fixture
+def random_walk() -> np.ndarray:
+    return np.random.default_rng(0).standard_normal(2_000).cumsum()
+
+
+@pytest.mark.parametrize("nlags", [1, 24, _FUSED_ACF_MAX_LAGS])
+def test_acf_fused_matches_statsmodels(random_walk, nlags):
+    np.testing.assert_allclose(acf_fused(random_walk, nlags), acf(random_walk, nlags=nlags),
+                               rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("nlags", [_FUSED_ACF_MAX_LAGS - 1, _FUSED_ACF_MAX_LAGS,
+                                   _FUSED_ACF_MAX_LAGS + 1])
+def test_acf_matches_statsmodels_around_kernel_switch(random_walk, nlags):
+    ts = pd.Series(random_walk, index=pd.date_range("2020-01-01", periods=len(random_walk), freq="h"))
+    np.testing.assert_allclose(UnivariateEDA(ts).acf_values(nlags), acf(random_walk, nlags=nlags),
+                               rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("window", [1, 2, 24])
+def test_rolling_mean_std_matches_pandas(random_walk, window):
+    x = random_walk.copy()
+    x[[5, 100, 101, 102, 1500]] = np.nan
+    mean, std = rolling_mean_std(x, window)
+
+    rolling = pd.Series(x).rolling(window)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-7, atol=1e-7)
+
+
+def test_lttb_indices_keeps_endpoints_and_order(random_walk):
+    x = np.arange(len(random_walk), dtype=np.float64)
+    idx = lttb_indices(x, random_walk, 100)
+
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == len(random_walk) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_indices_skips_nan_buckets():
+    y = np.sin(np.linspace(0, 20, 1_000))
+    y[300:400] = np.nan
+    idx = lttb_indices(np.arange(len(y), dtype=np.float64), y, 50)
+
+    # Only the buckets lying entirely inside the NaN run may pick a NaN
+    edges = 1 + (np.arange(49) * (998 / 48)).astype(np.int64)
+    edges[-1] = 999
+    all_nan_buckets = np.sum((edges[:-1] >= 300) & (edges[1:] <= 400))
+    assert np.isnan(y[idx]).sum() == all_nan_buckets
+    assert np.all(np.diff(idx) > 0)
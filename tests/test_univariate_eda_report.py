@@ -0,0 +1,30 @@
+"""Tests of the UnivaritateEDAReport panels on short series."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ts_trove.eda import UnivariateEDA, UnivaritateEDAReport
+
+
+@pytest.mark.parametrize("periods", [4, 10, 30])
+def test_report_of_a_short_hourly_series(tmp_path, periods):
+    ts = pd.Series(np.random.default_rng(0).standard_normal(periods).cumsum(),
+                   index=pd.date_range("2020-01-01", periods=periods, freq="h"))
+    report = UnivaritateEDAReport(UnivariateEDA(ts))
+
+    report.generate(tmp_path)
+
+    assert (tmp_path / "univariate_eda_report.html").stat().st_size > 0
+    # The daily resampled series is too short for a single lag, so only the first row is plotted
+    assert len(report._self_correlation_panel().data) == 2
+
+
+def test_report_plots_the_resampled_row_once_it_has_enough_points(tmp_path):
+    ts = pd.Series(np.random.default_rng(0).standard_normal(24 * 5).cumsum(),
+                   index=pd.date_range("2020-01-01", periods=24 * 5, freq="h"))
+    report = UnivaritateEDAReport(UnivariateEDA(ts))
+
+    report.generate(tmp_path)
+
+    assert len(report._self_correlation_panel().data) == 4
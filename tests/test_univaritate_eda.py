@@ -0,0 +1,134 @@
+"""Tests of UnivariateEDA, checked against pandas and statsmodels where they overlap."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.stattools import acf, adfuller, pacf
+
+from ts_trove.eda import UnivariateEDA
+
+
+@pytest.fixture
+def hourly() -> pd.Series:
+    values = np.random.default_rng(0).standard_normal(500).cumsum()
+    return pd.Series(values, index=pd.date_range("2020-01-01", periods=500, freq="h"))
+
+
+@pytest.fixture
+def panel() -> pd.DataFrame:
+    values = np.random.default_rng(1).standard_normal((500, 6)).cumsum(axis=0)
+    return pd.DataFrame(values, columns=[f"series_{i}" for i in range(6)])
+
+
+def test_batch_acf_matches_statsmodels(panel):
+    result = UnivariateEDA.batch_acf(panel, nlags=40)
+
+    assert result.shape == (41, panel.shape[1])
+    assert list(result.columns) == list(panel.columns)
+    for column in panel:
+        np.testing.assert_allclose(result[column], acf(panel[column], nlags=40), atol=1e-12)
+
+
+def test_batch_pacf_matches_statsmodels(panel):
+    result = UnivariateEDA.batch_pacf(panel, nlags=40)
+
+    assert result.shape == (41, panel.shape[1])
+    for column in panel:
+        np.testing.assert_allclose(result[column], pacf(panel[column], nlags=40), atol=1e-9)
+
+
+def test_batch_nlags_are_validated():
+    panel = pd.DataFrame(np.random.default_rng(2).standard_normal((10, 2)))
+
+    with pytest.raises(ValueError):
+        UnivariateEDA.batch_acf(panel, nlags=10)
+    with pytest.raises(ValueError):
+        UnivariateEDA.batch_pacf(panel, nlags=6)
+
+
+def test_nullable_float_series_is_described(hourly):
+    eda = UnivariateEDA(hourly.astype("Float64"))
+
+    assert eda.describe_acf(nlags=10) == pytest.approx(UnivariateEDA(hourly).describe_acf(nlags=10))
+    assert eda.describe_stationarity()["p_value"] == pytest.approx(adfuller(hourly, autolag="AIC")[1])
+
+
+def test_nullable_missing_values_become_nan(hourly):
+    nullable = hourly.astype("Float64")
+    nullable.iloc[10] = pd.NA
+    eda = UnivariateEDA(nullable)
+
+    assert np.isnan(eda.diff_cached()[[9, 10]]).all()
+    assert eda.describe_distribution()["max"] == hourly.drop(hourly.index[10]).max()
+
+
+def test_reassigning_ts_drops_cached_results(hourly):
+    eda = UnivariateEDA(hourly)
+    eda.describe_acf(nlags=10)
+    eda.describe_stationarity()
+    eda.diff_cached()
+
+    reversed_ts = pd.Series(hourly.to_numpy()[::-1].copy(), index=hourly.index)
+    eda.ts = reversed_ts
+
+    assert list(eda.describe_acf(nlags=10).values()) == pytest.approx(acf(reversed_ts, nlags=10))
+    assert eda.describe_stationarity()["adf_statistic"] == pytest.approx(
+        adfuller(reversed_ts, autolag="AIC")[0])
+    np.testing.assert_array_equal(eda.diff_cached(), np.diff(reversed_ts.to_numpy()))
+
+
+def _describe_index(index: pd.DatetimeIndex) -> dict:
+    return UnivariateEDA(pd.Series(np.arange(len(index), dtype=np.float64), index=index)).describe_time_index()
+
+
+def test_time_index_with_hourly_gaps():
+    full = pd.date_range("2020-01-01", periods=500, freq="h")
+    description = _describe_index(full.delete([3, 100, 101, 102]))
+
+    assert description["n_missing_timestamps"] == 4
+    assert description["missing_timestamps"] == full[[3, 100, 101, 102]].tolist()
+
+
+def test_time_index_with_an_off_grid_timestamp():
+    index = pd.date_range("2020-01-01", periods=500, freq="h").union(pd.DatetimeIndex(["2020-01-10 12:30"]))
+    description = _describe_index(index)
+
+    assert description["n_missing_timestamps"] == 0
+    assert description["missing_timestamps"] == []
+
+
+@pytest.mark.parametrize("freq", ["B", "ME"])
+def test_time_index_with_calendar_frequency(freq):
+    full = pd.date_range("2020-01-01", periods=60, freq=freq)
+
+    assert _describe_index(full)["n_missing_timestamps"] == 0
+    description = _describe_index(full.delete([5, 20, 21]))
+    assert description["n_missing_timestamps"] == 3
+    assert description["missing_timestamps"] == full[[5, 20, 21]].tolist()
+
+
+def test_daily_tz_aware_time_index_across_dst_change():
+    full = pd.date_range("2020-03-20", "2020-04-10", freq="D", tz="Europe/Paris")
+    description = _describe_index(full.delete(10))
+
+    assert description["n_missing_timestamps"] == 1
+    assert description["missing_timestamps"] == [full[10]]
+
+
+@pytest.mark.parametrize("values", [[], [np.nan, np.nan]])
+def test_distribution_of_a_series_without_values_is_nan(values):
+    index = pd.date_range("2020-01-01", periods=len(values), freq="h")
+    description = UnivariateEDA(pd.Series(values, index=index, dtype=np.float64)).describe_distribution()
+
+    assert description.keys() == UnivariateEDA(pd.Series([1.0, 2.0, 4.0])).describe_distribution().keys()
+    assert all(np.isnan(value) for value in description.values())
+
+
+def test_public_accessors_share_the_cached_results(hourly):
+    eda = UnivariateEDA(hourly)
+
+    np.testing.assert_array_equal(eda.values(), hourly.to_numpy())
+    assert eda.resampled("D") is eda.resampled("D")
+    pd.testing.assert_series_equal(eda.resampled("D"), hourly.resample("D").mean())
+    assert eda.acf_values(10, "D") is eda.acf_values(10, "D")
+    assert list(eda.describe_acf(nlags=10).values()) == pytest.approx(eda.acf_values(10))